@@ -17,13 +17,42 @@
 # =====================================================================================
 
 import tkinter as tk
-from tkinter import filedialog, scrolledtext, messagebox, font, colorchooser
-import json
+from tkinter import filedialog, messagebox, font, colorchooser, ttk
+import codecs
+import contextlib
+import errno
+import functools
+import io
+import mmap
 import os
+import stat
 import sys
+import tempfile
+
+# Use the faster orjson for the settings file when available, otherwise the standard library.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode('utf-8')
+
+    _loads = json.loads
 
 # --- Constants ---
 SETTINGS_FILE = "editor_settings.json"
+MAX_UNDO = 1000  # Maximum number of undo steps kept per window.
+MAX_RECENT_FILES = 5  # Number of entries kept in the 'Recent Files' menu.
+LOAD_CHUNK_SIZE = 1 << 20  # Characters read per chunk when opening a file (~1 MiB).
+MMAP_THRESHOLD = 8 << 20  # Files larger than this (in bytes) are memory-mapped when opened.
+SAVE_CHUNK_LINES = 1024  # Lines fetched from the text area per write when saving.
+SAVE_BUFFER_SIZE = 1 << 20  # Write buffer size used when saving a file.
 
 # --- Platform-specific Configuration ---
 # Detect if the OS is macOS to use 'Command' key instead of 'Control'.
@@ -31,6 +60,20 @@ IS_MAC = sys.platform == 'darwin'
 ACCELERATOR_MODIFIER = "Cmd" if IS_MAC else "Ctrl"
 BINDING_MODIFIER = "Command" if IS_MAC else "Control"
 
+# Menu accelerator labels, built once at import rather than for every window.
+_ACC_N = f"{ACCELERATOR_MODIFIER}+N"
+_ACC_SHIFT_N = f"{ACCELERATOR_MODIFIER}+Shift+N"
+_ACC_O = f"{ACCELERATOR_MODIFIER}+O"
+_ACC_S = f"{ACCELERATOR_MODIFIER}+S"
+_ACC_SHIFT_S = f"{ACCELERATOR_MODIFIER}+Shift+S"
+_ACC_Z = f"{ACCELERATOR_MODIFIER}+Z"
+_ACC_Y = f"{ACCELERATOR_MODIFIER}+Y"
+_ACC_X = f"{ACCELERATOR_MODIFIER}+X"
+_ACC_C = f"{ACCELERATOR_MODIFIER}+C"
+_ACC_V = f"{ACCELERATOR_MODIFIER}+V"
+_ACC_PLUS = f"{ACCELERATOR_MODIFIER}++"
+_ACC_MINUS = f"{ACCELERATOR_MODIFIER}+-"
+
 
 class TextEditor:
     """
@@ -51,7 +94,11 @@ class TextEditor:
         self.root = master_window
         self.controller = app_controller
         self.file_path = None
+        self._file_basename = "Untitled"  # Cached display name of file_path.
         self.is_dirty = False  # Tracks if there are unsaved changes.
+        self._modified_after_id = None  # Pending idle callback handling <<Modified>>.
+        self._autosave_id = None  # Pending autosave, scheduled once the text becomes dirty.
+        self._recent_dirty = True  # The 'Recent Files' menu needs rebuilding before it is shown.
 
         # Load shared settings from the controller.
         self.load_settings()
@@ -60,8 +107,6 @@ class TextEditor:
 
         # Set the behavior for when the window's close button is clicked.
         self.root.protocol("WM_DELETE_WINDOW", self.close_window)
-        # Start the periodic autosave check.
-        self.start_autosave_loop()
 
     # --- Setup and Configuration ---
 
@@ -80,21 +125,28 @@ class TextEditor:
         self.root.title("Untitled - Simple Text Editor")
         self.root.geometry("800x600")
 
-        # The font object is configured once and can be updated later.
-        self.editor_font = font.Font(family=self.font_family, size=self.font_size)
+        # Font objects are shared between windows through the controller.
+        self.editor_font = self.controller.get_font(self.font_family, self.font_size)
 
         # --- Main Text Widget ---
-        # ScrolledText is a convenient wrapper around the Text widget that includes a scrollbar.
-        self.text_area = scrolledtext.ScrolledText(
-            self.root,
+        # A plain Text widget with its own scrollbar, so the undo stack can be bounded.
+        text_frame = tk.Frame(self.root)
+        text_frame.pack(expand=True, fill='both')
+        self.text_area = tk.Text(
+            text_frame,
             wrap=tk.WORD,
             undo=True,  # This enables the undo/redo stack.
+            maxundo=MAX_UNDO,  # Caps the memory used by the undo stack.
+            autoseparators=True,  # Groups edits into undo steps instead of single characters.
             font=self.editor_font,
             fg=self.font_color,
             bg=self.bg_color,
             insertbackground=self.font_color  # Sets the cursor color to match the font.
         )
-        self.text_area.pack(expand=True, fill='both')
+        scrollbar = ttk.Scrollbar(text_frame, command=self.text_area.yview)
+        self.text_area.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text_area.pack(side=tk.LEFT, expand=True, fill='both')
         self.text_area.focus_set()  # Place the cursor in the text area on launch.
 
         # --- Status Bar ---
@@ -108,7 +160,7 @@ class TextEditor:
         # --- Event Bindings ---
         # The <<Modified>> virtual event is triggered whenever the text content changes.
         self.text_area.bind("<<Modified>>", self.on_text_modified)
-        self.bind_shortcuts()
+        # Keyboard shortcuts are bound once for all windows by AppController.bind_shortcuts.
 
         self.update_status_bar()
 
@@ -120,18 +172,21 @@ class TextEditor:
         # --- File Menu ---
         file_menu = tk.Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="New File", accelerator=f"{ACCELERATOR_MODIFIER}+N", command=self.new_file)
-        file_menu.add_command(label="New Window", accelerator=f"{ACCELERATOR_MODIFIER}+Shift+N",
+        file_menu.add_command(label="New File", accelerator=_ACC_N, command=self.new_file)
+        file_menu.add_command(label="New Window", accelerator=_ACC_SHIFT_N,
                               command=self.controller.create_new_window)
-        file_menu.add_command(label="Open...", accelerator=f"{ACCELERATOR_MODIFIER}+O", command=self.open_file_dialog)
+        file_menu.add_command(label="Open...", accelerator=_ACC_O, command=self.open_file_dialog)
 
-        self.recent_menu = tk.Menu(file_menu, tearoff=0)
+        # The submenu is only filled in when it is about to be shown.
+        self.recent_menu = tk.Menu(file_menu, tearoff=0, postcommand=self._on_recent_menu_post)
         file_menu.add_cascade(label="Recent Files", menu=self.recent_menu)
-        self.controller.update_all_recent_files_menus()
+        # Fixed slots that are relabelled in place as the recent files list changes.
+        for _ in range(MAX_RECENT_FILES):
+            self.recent_menu.add_command(label="(empty)", state="disabled")
 
         file_menu.add_separator()
-        file_menu.add_command(label="Save", accelerator=f"{ACCELERATOR_MODIFIER}+S", command=self.save_file)
-        file_menu.add_command(label="Save As...", accelerator=f"{ACCELERATOR_MODIFIER}+Shift+S",
+        file_menu.add_command(label="Save", accelerator=_ACC_S, command=self.save_file)
+        file_menu.add_command(label="Save As...", accelerator=_ACC_SHIFT_S,
                               command=self.save_as_file)
         file_menu.add_separator()
         file_menu.add_checkbutton(label="Autosave", onvalue=True, offvalue=False, variable=self.autosave_enabled_var)
@@ -146,14 +201,14 @@ class TextEditor:
         # --- Edit Menu ---
         edit_menu = tk.Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="Edit", menu=edit_menu)
-        edit_menu.add_command(label="Undo", accelerator=f"{ACCELERATOR_MODIFIER}+Z", command=self.text_area.edit_undo)
-        edit_menu.add_command(label="Redo", accelerator=f"{ACCELERATOR_MODIFIER}+Y", command=self.text_area.edit_redo)
+        edit_menu.add_command(label="Undo", accelerator=_ACC_Z, command=self.text_area.edit_undo)
+        edit_menu.add_command(label="Redo", accelerator=_ACC_Y, command=self.text_area.edit_redo)
         edit_menu.add_separator()
-        edit_menu.add_command(label="Cut", accelerator=f"{ACCELERATOR_MODIFIER}+X",
+        edit_menu.add_command(label="Cut", accelerator=_ACC_X,
                               command=lambda: self.text_area.event_generate("<<Cut>>"))
-        edit_menu.add_command(label="Copy", accelerator=f"{ACCELERATOR_MODIFIER}+C",
+        edit_menu.add_command(label="Copy", accelerator=_ACC_C,
                               command=lambda: self.text_area.event_generate("<<Copy>>"))
-        edit_menu.add_command(label="Paste", accelerator=f"{ACCELERATOR_MODIFIER}+V",
+        edit_menu.add_command(label="Paste", accelerator=_ACC_V,
                               command=lambda: self.text_area.event_generate("<<Paste>>"))
 
         # --- Format Menu ---
@@ -166,31 +221,39 @@ class TextEditor:
         # --- View Menu ---
         view_menu = tk.Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(label="Increase Font Size", accelerator=f"{ACCELERATOR_MODIFIER}++",
+        view_menu.add_command(label="Increase Font Size", accelerator=_ACC_PLUS,
                               command=self.increase_font_size)
-        view_menu.add_command(label="Decrease Font Size", accelerator=f"{ACCELERATOR_MODIFIER}+-",
+        view_menu.add_command(label="Decrease Font Size", accelerator=_ACC_MINUS,
                               command=self.decrease_font_size)
 
-    def bind_shortcuts(self):
-        """Binds keyboard shortcuts to their respective functions using the correct modifier."""
-        self.root.bind(f"<{BINDING_MODIFIER}-n>", self.new_file)
-        self.root.bind(f"<{BINDING_MODIFIER}-N>", self.controller.create_new_window)
-        self.root.bind(f"<{BINDING_MODIFIER}-o>", self.open_file_dialog)
-        self.root.bind(f"<{BINDING_MODIFIER}-s>", self.save_file)
-        self.root.bind(f"<{BINDING_MODIFIER}-S>", self.save_as_file)  # Capital 'S' for Shift+s
-        self.root.bind(f"<{BINDING_MODIFIER}-plus>", self.increase_font_size)
-        self.root.bind(f"<{BINDING_MODIFIER}-equal>", self.increase_font_size)
-        self.root.bind(f"<{BINDING_MODIFIER}-minus>", self.decrease_font_size)
-        # Note: Undo/Redo/Cut/Copy/Paste are often handled by the OS/Tkinter,
-        # but explicit bindings can be added here if they feel inconsistent on any platform.
-        # e.g., self.root.bind(f"<{BINDING_MODIFIER}-z>", lambda e: self.text_area.edit_undo())
+    def _on_recent_menu_post(self):
+        """Refreshes the 'Recent Files' menu right before it is posted, if it is stale."""
+        if self._recent_dirty:
+            self.update_recent_files_menu()
+            self._recent_dirty = False
+
+    def update_recent_files_menu(self):
+        """Rewrites the 'Recent Files' slots of this window from the shared settings."""
+        recent_files = self.controller.recent_files
+        for i in range(MAX_RECENT_FILES):
+            if i < len(recent_files):
+                path, base_name = recent_files[i]
+                # functools.partial binds the path without building a Python closure.
+                self.recent_menu.entryconfigure(
+                    i,
+                    label=base_name,
+                    state="normal",
+                    command=functools.partial(self._open_file_at_path, path)
+                )
+            else:
+                self.recent_menu.entryconfigure(i, label="(empty)", state="disabled")
 
     # --- Core Functionality ---
 
     def new_file(self, event=None):
         """Clears the text area to start a new file."""
         if self._check_unsaved_changes():
-            self.file_path = None
+            self._set_file_path(None)
             self.text_area.delete(1.0, tk.END)
             self.text_area.edit_reset()  # Clears the undo/redo stack.
             self.is_dirty = False
@@ -210,32 +273,85 @@ class TextEditor:
 
     def _open_file_at_path(self, path):
         """Helper function to load content from a given file path."""
+        # Open the file and decode its first chunk before touching the text area,
+        # so a missing or undecodable file leaves the current content untouched.
         try:
-            with open(path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            chunks = self._read_file_chunks(path)
+            first_chunk = next(chunks, "")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open file:\n{e}", master=self.root)
+            return
 
+        try:
             self.text_area.delete(1.0, tk.END)
-            self.text_area.insert(tk.END, content)
-
-            self.file_path = path
-            self.is_dirty = False
-            self.text_area.edit_reset()
+            # Stream the file in chunks so large files are never held twice in memory
+            # and the window stays responsive while loading.
+            self.text_area.insert(tk.END, first_chunk)
+            for chunk in chunks:
+                self.text_area.insert(tk.END, chunk)
+                self.root.update_idletasks()
+        except Exception as e:
+            # The old content is gone and the new one is incomplete: detach the editor
+            # from any file so a save can never write partial content over a real file.
+            self._set_file_path(None)
+            self.is_dirty = True
             self.update_title()
             self.update_status_bar()
-            self.controller.add_to_recent_files(path)
-        except Exception as e:
             messagebox.showerror("Error", f"Could not open file:\n{e}", master=self.root)
+            return
 
-    def save_file(self, event=None):
-        """Saves the current file to its existing path, or prompts for a new path."""
+        self._set_file_path(path)
+        self.is_dirty = False
+        self.text_area.edit_reset()
+        # Tk queues <<Modified>> rather than firing it during the load, and
+        # update_idletasks() does not deliver it. Clearing the flag here means the
+        # queued event finds nothing modified, so the load does not mark the file dirty.
+        self.text_area.edit_modified(False)
+        self.update_title()
+        self.update_status_bar()
+        self.controller.add_to_recent_files(path)
+
+    @staticmethod
+    def _read_file_chunks(path):
+        """
+        Yields the decoded content of a UTF-8 file in chunks.
+
+        Files larger than MMAP_THRESHOLD are memory-mapped and decoded slab by slab,
+        so no intermediate copy of the whole file is made. Newlines are translated
+        the same way as a text-mode open() would.
+        """
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size <= MMAP_THRESHOLD:
+                text_file = io.TextIOWrapper(file, encoding='utf-8')
+                while True:
+                    chunk = text_file.read(LOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+                return
+
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder('utf-8')(), translate=True
+            )
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, size, LOAD_CHUNK_SIZE):
+                    end = offset + LOAD_CHUNK_SIZE
+                    yield decoder.decode(mm[offset:end], final=end >= size)
+
+    def save_file(self, event=None, sync=False):
+        """
+        Saves the current file to its existing path, or prompts for a new path.
+        If sync is True (used by autosave), the data is flushed to disk.
+        See _write_file for how the file is written.
+        """
         # If no path exists, this is the same as "Save As".
         if not self.file_path:
             return self.save_as_file()
 
         try:
-            content = self.text_area.get(1.0, "end-1c")  # Get all text minus the trailing newline.
-            with open(self.file_path, 'w', encoding='utf-8') as file:
-                file.write(content)
+            self._write_file(os.path.realpath(self.file_path), sync)
+            self._cancel_autosave()
 
             self.is_dirty = False
             self.update_title()
@@ -245,6 +361,72 @@ class TextEditor:
             messagebox.showerror("Error", f"Could not save file:\n{e}", master=self.root)
             return False  # Indicate failure.
 
+    def _write_file(self, target_path, sync):
+        """
+        Writes the text area's content to target_path (symlinks already resolved).
+
+        Normally the text goes to a temporary file next to the target, which then
+        atomically replaces it. Only the permission bits are carried over; the owner,
+        group and extended attributes of the old file are not. A read-only target
+        is refused, as a plain write would be. The file is written in place instead
+        when the directory is not writable or the target has other hard links,
+        since a swap would fail or break those links.
+        """
+        try:
+            st = os.stat(target_path)
+        except FileNotFoundError:
+            st = None
+        if st is not None and not os.access(target_path, os.W_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), target_path)
+
+        if st is None or st.st_nlink == 1:
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target_path), suffix=".tmp")
+            except PermissionError:
+                pass  # The directory is not writable; fall back to writing in place.
+            else:
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8', buffering=SAVE_BUFFER_SIZE) as file:
+                        self._write_text_to(file, sync)
+                    os.chmod(tmp_path, self._file_mode_for(target_path))
+                    os.replace(tmp_path, target_path)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        os.remove(tmp_path)
+                    raise
+                return
+
+        with open(target_path, 'w', encoding='utf-8', buffering=SAVE_BUFFER_SIZE) as file:
+            self._write_text_to(file, sync)
+
+    @staticmethod
+    def _file_mode_for(path):
+        """
+        Returns the permission bits to give a saved file: those of the existing file,
+        or the default for new files under the current umask (mkstemp uses 0600).
+        """
+        try:
+            return stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    def _write_text_to(self, file, sync=False):
+        """
+        Writes the text area's content to an open file in line-range chunks.
+        If sync is True, the file is flushed to disk afterwards.
+        """
+        last_line = int(self.text_area.index("end-1c").split(".")[0])
+        for start in range(1, last_line + 1, SAVE_CHUNK_LINES):
+            end = start + SAVE_CHUNK_LINES
+            # The final chunk stops at "end-1c" to skip the newline Tk always appends.
+            end_index = f"{end}.0" if end <= last_line else "end-1c"
+            file.write(self.text_area.get(f"{start}.0", end_index))
+        if sync:
+            file.flush()
+            os.fsync(file.fileno())
+
     def save_as_file(self, event=None):
         """Shows the OS 'Save File' dialog and saves the content to a new path."""
         path = filedialog.asksaveasfilename(
@@ -252,7 +434,7 @@ class TextEditor:
             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
         )
         if path:
-            self.file_path = path
+            self._set_file_path(path)
             return self.save_file()
         return False  # User cancelled the dialog.
 
@@ -260,51 +442,77 @@ class TextEditor:
         """Handles the logic for closing this editor window."""
         if self._check_unsaved_changes():
             # If confirmed, proceed with closing.
+            if self._modified_after_id:
+                self.root.after_cancel(self._modified_after_id)
+            self._cancel_autosave()
             self.controller.on_window_close(self)
             self.root.destroy()
+            self.controller.release_font(self.editor_font)
+            self.editor_font = None  # Drop the last reference so Tk can delete the font.
 
     # --- Event Handlers and Updates ---
 
     def on_text_modified(self, event=None):
         """
         Callback function for when the text area content is changed.
+        The actual work is deferred until Tk is idle, so a burst of edits is handled once.
+        """
+        if self.text_area.edit_modified() and self._modified_after_id is None:
+            self._modified_after_id = self.root.after_idle(self._flush_modified)
+
+    def _flush_modified(self):
+        """
+        Handles the edits coalesced by on_text_modified.
         The <<Modified>> virtual event requires the flag to be manually reset.
         """
-        if self.text_area.edit_modified():
+        self._modified_after_id = None
+        if not self.text_area.edit_modified():
+            return  # The flag was reset in the meantime (e.g. a file was loaded).
+
+        # The title only changes on the clean -> dirty transition.
+        if not self.is_dirty:
             self.is_dirty = True
             self.update_title()
-            self.update_status_bar()
-            # We must reset the flag, otherwise this event won't fire again
-            # until the text area is cleared and re-inserted.
-            self.text_area.edit_modified(False)
+        self.update_status_bar()
+        # Schedule a single autosave for this batch of edits, if none is pending.
+        if self._autosave_id is None and self.autosave_enabled_var.get() and self.file_path:
+            self._autosave_id = self.root.after(self.autosave_interval, self._do_autosave)
+        # We must reset the flag, otherwise this event won't fire again
+        # until the text area is cleared and re-inserted.
+        self.text_area.edit_modified(False)
 
     def update_title(self):
         """Updates the window title, adding a '*' if the file is dirty (unsaved)."""
-        base_name = os.path.basename(self.file_path) if self.file_path else "Untitled"
         dirty_marker = "*" if self.is_dirty else ""
-        self.root.title(f"{dirty_marker}{base_name} - Simple Text Editor")
+        self.root.title(f"{dirty_marker}{self._file_basename} - Simple Text Editor")
 
     def update_status_bar(self, event=None):
         """Updates the status bar with current font size and character count."""
-        char_count = len(self.text_area.get(1.0, "end-1c"))
+        # Let Tk count characters itself instead of copying the whole buffer into Python.
+        # Text.count returns None (not a zero tuple) for an empty range.
+        char_count = (self.text_area.count("1.0", "end-1c", "chars") or (0,))[0]
         status_text = f"Font: {self.font_family} {self.font_size}    |    Characters: {char_count}"
         self.status_bar.config(text=status_text)
 
-    def start_autosave_loop(self):
-        """The recurring function that performs the autosave check."""
-        # Only save if autosave is enabled, the file has a path, and has been modified.
+    def _do_autosave(self):
+        """Performs the autosave scheduled by on_text_modified."""
+        self._autosave_id = None
+        # Re-check, since autosave may have been disabled since it was scheduled.
         if self.autosave_enabled_var.get() and self.is_dirty and self.file_path:
-            self.save_file()
+            self.save_file(sync=True)
 
-        # Schedule this function to run again after the specified interval.
-        self.root.after(self.autosave_interval, self.start_autosave_loop)
+    def _cancel_autosave(self):
+        """Cancels any pending autosave."""
+        if self._autosave_id is not None:
+            self.root.after_cancel(self._autosave_id)
+            self._autosave_id = None
 
     # --- Formatting Options ---
 
     def increase_font_size(self, event=None):
         """Increases the font size by 1 point."""
         self.font_size += 1
-        self.editor_font.configure(size=self.font_size)
+        self._apply_font()
         self.update_status_bar()
         return "break"  # Prevents the event from propagating further.
 
@@ -312,7 +520,7 @@ class TextEditor:
         """Decreases the font size by 1 point, with a minimum size of 4."""
         if self.font_size > 4:
             self.font_size -= 1
-            self.editor_font.configure(size=self.font_size)
+            self._apply_font()
             self.update_status_bar()
         return "break"
 
@@ -325,19 +533,26 @@ class TextEditor:
         listbox = tk.Listbox(win)
         listbox.pack(expand=True, fill='both', padx=10, pady=10)
 
-        fonts = sorted(font.families())
-        for f in fonts:
-            listbox.insert(tk.END, f)
+        # Insert all families in a single Tcl call.
+        listbox.insert(tk.END, *self.controller.get_font_families())
 
         def on_select(evt):
             selection = listbox.get(listbox.curselection())
             self.font_family = selection
-            self.editor_font.configure(family=self.font_family)
+            self._apply_font()
             self.update_status_bar()
             win.destroy()
 
         listbox.bind("<<ListboxSelect>>", on_select)
 
+    def _apply_font(self):
+        """Switches the text area to the shared font matching the current family and size."""
+        old_font = self.editor_font
+        self.editor_font = self.controller.get_font(self.font_family, self.font_size)
+        self.text_area.config(font=self.editor_font)
+        # Release the previous font only once the widget no longer uses it.
+        self.controller.release_font(old_font)
+
     def change_font_color(self):
         """Opens a color picker to change the text color."""
         color = colorchooser.askcolor(title="Choose Font Color", initialcolor=self.font_color)
@@ -354,12 +569,20 @@ class TextEditor:
 
     # --- Utility Methods ---
 
+    def _set_file_path(self, path):
+        """Sets the current file path and caches its display name."""
+        self.file_path = path
+        self._file_basename = os.path.basename(path) if path else "Untitled"
+
     def _check_unsaved_changes(self):
         """
         Checks for unsaved changes and prompts the user to save if necessary.
         Returns True if the action should proceed (user saved, discarded, or no changes),
         and False if the action should be cancelled.
         """
+        # An empty, untitled buffer has nothing worth saving (e.g. text typed then undone).
+        if not self.file_path and not self.text_area.count("1.0", "end-1c", "chars"):
+            return True
         if not self.is_dirty:
             return True
 
@@ -391,16 +614,56 @@ class AppController:
             root (tk.Tk): The main, hidden root window of the application.
         """
         self.root = root
+        self._font_families = None  # Sorted font families, computed on first use.
+        self._fonts = {}  # Shared [font, reference count] pairs, keyed by font name.
         self.editor_instances = []
+        self.editors_by_top = {}  # Maps each editor's Toplevel to its TextEditor.
         self.load_settings()
+        self.bind_shortcuts()
+
+    def bind_shortcuts(self):
+        """
+        Binds keyboard shortcuts once on the Text widget class, for all editor windows.
+        Each shortcut is dispatched to the editor owning the focused text area.
+        """
+        shortcuts = [
+            (f"<{BINDING_MODIFIER}-n>", "new_file"),
+            (f"<{BINDING_MODIFIER}-o>", "open_file_dialog"),
+            (f"<{BINDING_MODIFIER}-s>", "save_file"),
+            (f"<{BINDING_MODIFIER}-S>", "save_as_file"),  # Capital 'S' for Shift+s
+            (f"<{BINDING_MODIFIER}-plus>", "increase_font_size"),
+            (f"<{BINDING_MODIFIER}-equal>", "increase_font_size"),
+            (f"<{BINDING_MODIFIER}-minus>", "decrease_font_size"),
+        ]
+        for sequence, method_name in shortcuts:
+            self.root.bind_class("Text", sequence, functools.partial(self._dispatch_shortcut, method_name))
+        self.root.bind_class("Text", f"<{BINDING_MODIFIER}-N>", self.create_new_window)
+        # Note: Undo/Redo/Cut/Copy/Paste are often handled by the OS/Tkinter,
+        # but explicit bindings can be added here if they feel inconsistent on any platform.
+        # e.g., self.root.bind_class("Text", f"<{BINDING_MODIFIER}-z>", lambda e: e.widget.edit_undo())
+
+    def _dispatch_shortcut(self, method_name, event):
+        """Calls the named method on the editor whose window contains the event's widget."""
+        editor = self.editors_by_top.get(event.widget.winfo_toplevel())
+        if editor is not None:
+            return getattr(editor, method_name)(event)
 
     def load_settings(self):
         """Loads settings from the JSON file or uses defaults."""
-        try:
-            with open(SETTINGS_FILE, 'r') as f:
-                self.settings = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+        # On first launch there is no file; check for it rather than raising and catching.
+        if not os.path.isfile(SETTINGS_FILE):
             self.settings = {}
+        else:
+            try:
+                with open(SETTINGS_FILE, 'rb') as f:
+                    self.settings = _loads(f.read())
+            except (OSError, ValueError):  # Both JSON decoders raise ValueError subclasses.
+                self.settings = {}
+        self._cache_recent_files()
+
+    def _cache_recent_files(self):
+        """Rebuilds the (path, basename) list mirroring settings["recent_files"]."""
+        self.recent_files = [(path, os.path.basename(path)) for path in self.settings.get("recent_files", [])]
 
     def save_settings(self):
         """Saves the current settings to the JSON file."""
@@ -413,19 +676,57 @@ class AppController:
             self.settings["bg_color"] = last_editor.bg_color
             self.settings["autosave_enabled"] = last_editor.autosave_enabled_var.get()
 
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(self.settings, f, indent=4)
+        # Write to a temporary file and swap it in, so a crash never leaves a truncated file.
+        tmp_path = SETTINGS_FILE + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(self.settings))
+        os.replace(tmp_path, SETTINGS_FILE)
+
+    def get_font_families(self):
+        """Returns the sorted tuple of available font families, querying Tk only once."""
+        if self._font_families is None:
+            self._font_families = tuple(sorted(font.families()))
+        return self._font_families
+
+    def get_font(self, family, size):
+        """
+        Returns a named font for the given family and size, shared by all windows.
+        Every call must be balanced by a call to release_font once the font is no longer used.
+        """
+        name = f"editor_{family}_{size}"
+        entry = self._fonts.get(name)
+        if entry is None:
+            entry = self._fonts[name] = [font.Font(name=name, family=family, size=size), 0]
+        entry[1] += 1
+        return entry[0]
+
+    def release_font(self, font_obj):
+        """
+        Drops one reference to a shared font. When no window uses it anymore, the
+        controller forgets it, and Tk deletes the font once the caller's last
+        reference to the Font object goes away.
+        """
+        entry = self._fonts.get(font_obj.name)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._fonts[font_obj.name]
 
     def create_new_window(self, event=None):
         """Creates a new Toplevel window and initializes a TextEditor instance in it."""
         editor_window = tk.Toplevel(self.root)
         editor = TextEditor(editor_window, self)
+        self.editors_by_top[editor_window] = editor
         self.editor_instances.append(editor)
 
     def on_window_close(self, editor_instance):
         """Handles cleanup when an editor window is closed."""
-        if editor_instance in self.editor_instances:
+        self.editors_by_top.pop(editor_instance.root, None)
+        try:
             self.editor_instances.remove(editor_instance)
+        except ValueError:
+            pass
 
         # If the last window is closed, save settings and exit the app.
         if not self.editor_instances:
@@ -438,20 +739,15 @@ class AppController:
         if path in recent_files:
             recent_files.remove(path)
         recent_files.insert(0, path)
-        self.settings["recent_files"] = recent_files[:5]  # Keep the last 5 files.
+        self.settings["recent_files"] = recent_files[:MAX_RECENT_FILES]
+        self._cache_recent_files()
         self.update_all_recent_files_menus()
 
     def update_all_recent_files_menus(self):
-        """Updates the 'Recent Files' menu in all open editor windows."""
-        recent_files = self.settings.get("recent_files", [])
+        """Marks the 'Recent Files' menu of all open editor windows as stale."""
+        # Each window rebuilds its menu lazily, the next time it is opened.
         for editor in self.editor_instances:
-            editor.recent_menu.delete(0, tk.END)
-            for path in recent_files:
-                # Use a lambda with a default argument to capture the correct path.
-                editor.recent_menu.add_command(
-                    label=os.path.basename(path),
-                    command=lambda p=path: editor._open_file_at_path(p)
-                )
+            editor._recent_dirty = True
 
 
 def main():